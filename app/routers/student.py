@@ -1,10 +1,11 @@
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from database.database import SessionLocal
+from ..services.recommendation import TOP_K
 from ..services.student import StudentService
 from ..utility.exception import NotFoundException
 
@@ -58,6 +59,15 @@ async def get_book(db: db_dependency, book_id: int, student_id: int) -> dict:
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
+@router.get('/{book_id}/recommendations')
+async def get_recommendations(db: db_dependency, book_id: int, student_id: int, limit: Annotated[int, Query(ge=1, le=TOP_K)] = 10) -> BookResponse:
+    try:
+        student_service = StudentService(db)
+        books = student_service.get_recommendations(student_id, book_id, limit)
+        return books
+    except NotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
 @router.get('/borrow/{book_id}')
 async def borrow_book(book_id: int, student_id: int, db: db_dependency) -> dict:
     try:
@@ -2,7 +2,7 @@ from typing import Optional, List
 
 from sqlalchemy.orm import Session
 
-from database.models.models import Book, BookType, BookSubject
+from database.models.models import Book, BookCoBorrow, BookType, BookSubject
 from ..utility.exception import NotFoundException, InvalidPassword, ForbiddenError
 from ..utility.utils import BookTypeEnum
 
@@ -52,6 +52,10 @@ class LibrarianService:
             if book_model is None:
                 raise NotFoundException('Book does not exist.')
 
+            self.db.query(BookCoBorrow).filter(
+                (BookCoBorrow.book_id == book_id) | (BookCoBorrow.related_book_id == book_id)
+            ).delete(synchronize_session=False)
+
             self.db.query(Book).filter(Book.book_id == book_id).delete()
             self.db.commit()
         except Exception as e:
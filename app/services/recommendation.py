@@ -0,0 +1,171 @@
+import sys
+from typing import List
+
+from sqlalchemy import and_, delete, func, insert, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+
+from database.models.models import Book, BookCoBorrow, BorrowedBooks
+
+# Number of related books served per book.
+TOP_K: int = 50
+# Number of related books kept per book after pruning. Rows beyond TOP_K are
+# candidates that can still climb into the served list.
+CANDIDATE_K: int = TOP_K * 4
+
+
+class RecommendationService:
+    """
+    Maintains the "also borrowed" index (book_co_borrows), a sparse
+    book -> book table counting the students who borrowed both books.
+    Borrows only increment counts; prune() trims each book to its
+    candidate_k best rows and is meant to run on a schedule.
+    """
+    def __init__(self, db: Session, candidate_k: int = CANDIDATE_K):
+        self.db = db
+        self.candidate_k = candidate_k
+
+    def record_borrow(self, student_id: int, book_id: int) -> None:
+        """
+        Update the index for a new loan. Must be called before the loan row is
+        added; the caller commits. Re-borrowing a book the student already had
+        does not change any counts.
+        """
+        history = (
+            self.db.query(BorrowedBooks.book_id)
+            .filter(BorrowedBooks.student_id == student_id)
+            .distinct()
+            .all()
+        )
+        previous_book_ids = {row.book_id for row in history}
+        if book_id in previous_book_ids or not previous_book_ids:
+            return
+
+        pairs = [(book_id, other_id) for other_id in previous_book_ids]
+        pairs += [(other_id, book_id) for other_id in previous_book_ids]
+        # A fixed row order keeps concurrent upserts from deadlocking each other.
+        pairs.sort()
+
+        dialect_insert = sqlite.insert if self.db.get_bind().dialect.name == 'sqlite' else postgresql.insert
+        statement = dialect_insert(BookCoBorrow).values(
+            [{'book_id': pair[0], 'related_book_id': pair[1], 'count': 1} for pair in pairs]
+        )
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[BookCoBorrow.book_id, BookCoBorrow.related_book_id],
+                set_={'count': BookCoBorrow.count + 1},
+            )
+        )
+
+    def prune(self) -> int:
+        """
+        Drop every related book outside its book's candidate_k best rows.
+        A dropped pair restarts at zero if it is co-borrowed again, so a
+        count is never more than the largest count pruned from its book
+        below the true value. Returns the number of rows deleted.
+        """
+        ranked = select(
+            BookCoBorrow.book_id,
+            BookCoBorrow.related_book_id,
+            func.row_number().over(
+                partition_by=BookCoBorrow.book_id,
+                order_by=(BookCoBorrow.count.desc(), BookCoBorrow.related_book_id),
+            ).label('rank'),
+        ).subquery()
+        overflow = (
+            select(ranked.c.book_id, ranked.c.related_book_id)
+            .where(ranked.c.rank > self.candidate_k)
+        )
+        result = self.db.execute(
+            delete(BookCoBorrow)
+            .where(tuple_(BookCoBorrow.book_id, BookCoBorrow.related_book_id).in_(overflow))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the whole index from borrowed_books with exact counts, for
+        backfills or to reset the pruning error. Returns the number of rows written.
+        """
+        loans = (
+            select(BorrowedBooks.student_id, BorrowedBooks.book_id)
+            .distinct()
+            .subquery()
+        )
+        other = aliased(loans)
+        counts = (
+            select(
+                loans.c.book_id.label('book_id'),
+                other.c.book_id.label('related_book_id'),
+                func.count().label('count'),
+            )
+            .select_from(loans)
+            .join(other, and_(loans.c.student_id == other.c.student_id, loans.c.book_id != other.c.book_id))
+            .group_by(loans.c.book_id, other.c.book_id)
+            .subquery()
+        )
+        ranked = select(
+            counts,
+            func.row_number().over(
+                partition_by=counts.c.book_id,
+                order_by=(counts.c.count.desc(), counts.c.related_book_id),
+            ).label('rank'),
+        ).subquery()
+        top = (
+            select(ranked.c.book_id, ranked.c.related_book_id, ranked.c.count)
+            .where(ranked.c.rank <= self.candidate_k)
+        )
+
+        self.db.execute(delete(BookCoBorrow))
+        result = self.db.execute(
+            insert(BookCoBorrow).from_select(['book_id', 'related_book_id', 'count'], top)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def get_related_books(self, book_id: int, student_id: int, limit: int) -> List[Book]:
+        """
+        Top related books of book_id that are not currently on loan and that
+        the student has never borrowed.
+        """
+        on_loan = (
+            select(BorrowedBooks.borrow_id)
+            .where(BorrowedBooks.book_id == BookCoBorrow.related_book_id)
+            .where(BorrowedBooks.is_returned == False)
+        )
+        borrowed_by_student = (
+            select(BorrowedBooks.borrow_id)
+            .where(BorrowedBooks.book_id == BookCoBorrow.related_book_id)
+            .where(BorrowedBooks.student_id == student_id)
+        )
+        return (
+            self.db.query(Book)
+            .join(BookCoBorrow, BookCoBorrow.related_book_id == Book.book_id)
+            .filter(BookCoBorrow.book_id == book_id)
+            .filter(~on_loan.exists())
+            .filter(~borrowed_by_student.exists())
+            .order_by(BookCoBorrow.count.desc(), BookCoBorrow.related_book_id)
+            .limit(limit)
+            .all()
+        )
+
+
+if __name__ == '__main__':
+    from database.database import SessionLocal
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'rebuild'
+    if command not in ('rebuild', 'prune'):
+        sys.exit(f"Unknown command '{command}'. Use 'rebuild' or 'prune'.")
+
+    db: Session = SessionLocal()
+    try:
+        if command == 'rebuild':
+            rows = RecommendationService(db).rebuild()
+            print(f"Rebuilt book_co_borrows with {rows} rows.")
+        else:
+            rows = RecommendationService(db).prune()
+            print(f"Pruned {rows} rows from book_co_borrows.")
+    finally:
+        db.close()
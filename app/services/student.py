@@ -6,6 +6,7 @@ from sqlalchemy import Date, func, update
 
 from database.models.models import BookSubject
 
+from .recommendation import RecommendationService
 from ..utility.exception import NotFoundException
 from database.models.models import Book, BorrowedBooks, Student
 from ..utility.utils import BookTypeEnum
@@ -36,6 +37,15 @@ class StudentService:
         book_dict = self.book_subject_append(book)
         return book_dict
 
+    def get_recommendations(self, student_id: int, book_id: int, limit: int) -> dict:
+        student = self.get_student(student_id)
+        book = self.db.query(Book).filter(Book.book_id == book_id).first()
+        if book is None:
+            raise NotFoundException("Book does not exist.")
+        related_books = RecommendationService(self.db).get_related_books(book_id, student_id, limit)
+        related_books_with_subject = self.books_with_subject(related_books)
+        return {"student_name": student.name, "books": related_books_with_subject}
+
     def borrow_book(self, student_id: int, book_id: int) -> str:
         student = self.get_student(student_id)
         book = self.db.query(Book).filter(Book.book_id == book_id).first()
@@ -48,6 +58,8 @@ class StudentService:
         ).first():
             raise HTTPException(status_code=400, detail="Book already borrowed")
 
+        RecommendationService(self.db).record_borrow(student_id, book_id)
+
         borrowed_book = BorrowedBooks(student_id=student_id, book_id=book_id, borrow_date=func.now(), is_returned=False)
         self.db.add(borrowed_book)
         self.db.commit()
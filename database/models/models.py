@@ -1,5 +1,5 @@
 from ..database import Base
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 
 class Librarian(Base):
@@ -70,9 +70,23 @@ class BorrowedBooks(Base):
     """
     __tablename__ = 'borrowed_books'
     borrow_id = Column(Integer, primary_key=True)
-    student_id = Column(Integer, ForeignKey('students.student_id'))
-    book_id = Column(Integer, ForeignKey('books.book_id'))
+    student_id = Column(Integer, ForeignKey('students.student_id'), index=True)
+    book_id = Column(Integer, ForeignKey('books.book_id'), index=True)
     borrow_date = Column(Date)
     return_date = Column(Date)
     is_returned = Column(Boolean, default=False)
 
+class BookCoBorrow(Base):
+    """
+    book_id: Integer, PK, FK, Book.book_id
+    related_book_id: Integer, PK, FK, Book.book_id
+    count: Integer, number of students who borrowed both books
+    """
+    __tablename__ = 'book_co_borrows'
+    book_id = Column(Integer, ForeignKey('books.book_id'), primary_key=True)
+    related_book_id = Column(Integer, ForeignKey('books.book_id'), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('ix_book_co_borrows_book_id_count', 'book_id', 'count'),
+    )
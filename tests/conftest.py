@@ -0,0 +1,26 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database.models.models import Base, Book, BookType, Student
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    session.add(BookType(type_id=1, type_name='reading'))
+    session.add_all([Student(student_id=i, name=f"Student {i}", department="CS") for i in range(1, 6)])
+    session.add_all([Book(book_id=i, writer=f"Writer {i}", name=f"Book {i}", type_id=1) for i in range(1, 8)])
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
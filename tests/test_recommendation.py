@@ -0,0 +1,102 @@
+from datetime import date
+
+import pytest
+
+from app.services.recommendation import RecommendationService
+from app.services.student import StudentService
+from app.utility.exception import NotFoundException
+from database.models.models import BookCoBorrow, BorrowedBooks
+
+LOANS = [
+    (1, 1), (1, 2), (1, 3),
+    (2, 1), (2, 2),
+    (3, 2), (3, 3), (3, 4),
+    (4, 1), (4, 4),
+]
+
+
+def borrow_and_return(db, loans):
+    service = RecommendationService(db)
+    for student_id, book_id in loans:
+        service.record_borrow(student_id, book_id)
+        db.add(BorrowedBooks(student_id=student_id, book_id=book_id, borrow_date=date.today(),
+                             return_date=date.today(), is_returned=True))
+        db.commit()
+
+
+def index(db) -> dict:
+    return {(row.book_id, row.related_book_id): row.count for row in db.query(BookCoBorrow).all()}
+
+
+def test_borrow_counts_co_borrowed_pairs(db):
+    student_service = StudentService(db)
+    student_service.borrow_book(1, 1)
+    student_service.borrow_book(1, 2)
+    student_service.borrow_book(2, 3)
+    student_service.borrow_book(2, 4)
+    borrow_and_return(db, [(3, 1), (3, 2)])
+
+    assert index(db) == {(1, 2): 2, (2, 1): 2, (3, 4): 1, (4, 3): 1}
+
+
+def test_re_borrow_does_not_change_counts(db):
+    borrow_and_return(db, [(1, 1), (1, 2), (1, 1)])
+
+    assert index(db) == {(1, 2): 1, (2, 1): 1}
+
+
+def test_rebuild_matches_incremental_counts(db):
+    borrow_and_return(db, LOANS)
+    incremental = index(db)
+
+    rows = RecommendationService(db).rebuild()
+
+    assert rows == len(incremental)
+    assert index(db) == incremental
+
+
+def test_prune_keeps_best_candidates(db):
+    borrow_and_return(db, LOANS)
+
+    RecommendationService(db, candidate_k=1).prune()
+
+    assert index(db) == {(1, 2): 2, (2, 1): 2, (3, 2): 2, (4, 1): 1}
+
+
+def test_new_pair_builds_up_past_full_candidate_list(db):
+    service = RecommendationService(db, candidate_k=2)
+    borrow_and_return(db, [(1, 1), (1, 2), (1, 3)])
+    service.prune()
+
+    borrow_and_return(db, [(student_id, book_id) for student_id in (2, 3) for book_id in (1, 7)])
+    service.prune()
+
+    assert index(db)[(1, 7)] == 2
+    assert set(pair for pair in index(db) if pair[0] == 1) == {(1, 7), (1, 2)}
+
+
+def test_recommendations_skip_books_on_loan_and_student_history(db):
+    borrow_and_return(db, LOANS)
+    student_service = StudentService(db)
+    student_service.borrow_book(5, 3)
+
+    books = student_service.get_recommendations(2, 1, 10)["books"]
+
+    assert [book['book_id'] for book in books] == [4]
+
+
+def test_recommendations_limit(db):
+    borrow_and_return(db, LOANS)
+
+    books = StudentService(db).get_recommendations(5, 2, 1)["books"]
+
+    assert [book['book_id'] for book in books] == [1]
+
+
+def test_recommendations_not_found(db):
+    student_service = StudentService(db)
+
+    with pytest.raises(NotFoundException):
+        student_service.get_recommendations(99, 1, 10)
+    with pytest.raises(NotFoundException):
+        student_service.get_recommendations(1, 99, 10)